@@ -13,35 +13,47 @@ This script uses GITHUB_EVENT_NAME and GITHUB_EVENT_PATH provided by the runner.
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
+import re
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from github import Github
-from github.GithubException import GithubException
+import orjson
+
+if TYPE_CHECKING:
+    from github.Requester import Requester
 
 LOGGING: dict[str, Any] = {
     "handlers": [
         logging.StreamHandler(),
     ],
-    "format": "%(asctime)s.%(msecs)03d [%(levelname)s]: (%(name)s.%(funcName)s) %(message)s",
+    "format": "%(asctime)s [%(levelname)s]: (%(name)s.%(funcName)s) %(message)s",
     "level": logging.INFO,
     "datefmt": "%Y-%m-%d %H:%M:%S",
 }
-logging.basicConfig(**LOGGING)  # type: ignore[arg-type]
+# Don't reconfigure when imported by an already-configured process (e.g. tests)
+if not logging.getLogger().handlers:
+    logging.basicConfig(**LOGGING)  # type: ignore[arg-type]
 logger = logging.getLogger(__name__)
 
+_SPLIT = re.compile(r"[,\s]+")
+
 
 def get_input(name: str, default: str = "") -> str:
     # Support both dash and underscore variants just in case
-    candidates = [
-        f"INPUT_{name}",
-        f"INPUT_{name.replace('-', '_')}",
-        f"INPUT_{name.replace('_', '-')}",
-    ]
-    for key in candidates:
+    keys: tuple[str, ...] = (f"INPUT_{name}",)
+    if "-" in name or "_" in name:
+        keys = tuple(
+            dict.fromkeys(
+                (
+                    f"INPUT_{name}",
+                    f"INPUT_{name.replace('-', '_')}",
+                    f"INPUT_{name.replace('_', '-')}",
+                )
+            )
+        )
+    for key in keys:
         val = os.getenv(key)
         if val is not None:
             return val
@@ -51,28 +63,78 @@ def get_input(name: str, default: str = "") -> str:
 def split_list(raw: str) -> list[str]:
     if not raw:
         return []
-    # Split by comma or whitespace, strip @ and spaces, keep unique while preserving order
-    seen = set()
-    result: list[str] = []
-    for token in [
-        t.strip().lstrip("@") for part in raw.split(",") for t in part.split()
-    ]:
-        if token and token not in seen:
-            result.append(token)
-            seen.add(token)
-    return result
+    # Split by comma or whitespace, strip @, keep unique while preserving order
+    tokens = (t.lstrip("@") for t in _SPLIT.split(raw.strip()) if t)
+    return list(dict.fromkeys(t for t in tokens if t))
 
 
 def load_event() -> dict[str, Any]:
     path = os.getenv("GITHUB_EVENT_PATH")
     if not path:
         raise RuntimeError("GITHUB_EVENT_PATH is not set")
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)  # type: ignore[no-any-return]
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())  # type: ignore[no-any-return]
+
+
+def _handle_issue(
+    requester: Requester, slug: str, payload: dict[str, Any], assignees: list[str]
+) -> None:
+    number = payload["issue"]["number"]
+    if assignees:
+        logger.info(f"Assigning to issue #{number}: {assignees}")
+        requester.requestJsonAndCheck(
+            "POST",
+            f"/repos/{slug}/issues/{number}/assignees",
+            input={"assignees": assignees},
+        )
+    else:
+        logger.info("No assignees provided; skipping")
+    # Reviewers do not apply to issues
+
+
+def _handle_pr(
+    requester: Requester,
+    slug: str,
+    payload: dict[str, Any],
+    assignees: list[str],
+    reviewers: list[str],
+) -> None:
+    # Everything we need (number, author) is already in the event payload
+    pull_request = payload["pull_request"]
+    number = pull_request["number"]
+
+    if assignees:
+        logger.info(f"Assigning to PR #{number}: {assignees}")
+        requester.requestJsonAndCheck(
+            "POST",
+            f"/repos/{slug}/issues/{number}/assignees",
+            input={"assignees": assignees},
+        )
+    else:
+        logger.info("No assignees provided; skipping")
+
+    if reviewers:
+        # You cannot request a review from the PR author; filter to avoid API errors
+        author = pull_request.get("user", {}).get("login")
+        logger.info(f"PR author: {author}, requested reviewers: {reviewers}")
+        filtered = [r for r in reviewers if r != author]
+        if filtered:
+            logger.info(f"Requesting reviewers for PR #{number}: {filtered}")
+            requester.requestJsonAndCheck(
+                "POST",
+                f"/repos/{slug}/pulls/{number}/requested_reviewers",
+                input={"reviewers": filtered},
+            )
+        else:
+            logger.info(
+                f"All reviewers matched the PR author ({author}); cannot request review from yourself"
+            )
+    else:
+        logger.info("No reviewers provided; skipping")
 
 
 def main() -> int:
-    token = get_input("REPO_TOKEN") or get_input("REPO-TOKEN")
+    token = get_input("REPO_TOKEN")
     if not token:
         logger.error(
             "::error title=Missing token::INPUT_REPO_TOKEN (repo-token) is required"
@@ -88,56 +150,36 @@ def main() -> int:
         logger.error("::error title=Missing context::GITHUB_REPOSITORY is not set")
         return 1
 
-    gh = Github(token)
-    repo = gh.get_repo(repo_slug)
     payload = load_event()
 
-    try:
-        if event_name in {"issues"} and "issue" in payload:
-            number = payload["issue"]["number"]
-            issue = repo.get_issue(number=number)
-            if assignees:
-                logger.info(f"Assigning to issue #{number}: {assignees}")
-                issue.add_to_assignees(*assignees)
-            else:
-                logger.info("No assignees provided; skipping")
-            # Reviewers do not apply to issues
-            return 0
-
-        if (
-            event_name in {"pull_request", "pull_request_target"}
-            and "pull_request" in payload
-        ):
-            number = payload["pull_request"]["number"]
-            pr = repo.get_pull(number)
-
-            if assignees:
-                logger.info(f"Assigning to PR #{number}: {assignees}")
-                pr.as_issue().add_to_assignees(*assignees)
-            else:
-                logger.info("No assignees provided; skipping")
-
-            if reviewers:
-                # You cannot request a review from the PR author; filter to avoid API errors
-                author = payload["pull_request"].get("user", {}).get("login")
-                logger.info(f"PR author: {author}, requested reviewers: {reviewers}")
-                filtered = [r for r in reviewers if r != author]
-                if filtered:
-                    logger.info(f"Requesting reviewers for PR #{number}: {filtered}")
-                    pr.create_review_request(reviewers=filtered)
-                else:
-                    logger.info(
-                        f"All reviewers matched the PR author ({author}); cannot request review from yourself"
-                    )
-            else:
-                logger.info("No reviewers provided; skipping")
-            return 0
-
+    is_issue = event_name in {"issues"} and "issue" in payload
+    is_pr = (
+        event_name in {"pull_request", "pull_request_target"}
+        and "pull_request" in payload
+    )
+    if not (is_issue or is_pr):
         logger.info(
             f"Unsupported event: {event_name}. This action handles issues and pull_request events."
         )
         return 0
 
+    # Imported here so the early-exit paths above skip loading PyGithub and its
+    # dependency tree (requests, urllib3, jwt, nacl, ...)
+    from github import Github  # noqa: PLC0415
+    from github.GithubException import GithubException  # noqa: PLC0415
+
+    # lazy=True builds the repository handle without a GET; it only serves to
+    # reach the requester. The endpoints need just owner/repo/number, which we
+    # already have, so nothing is fetched before the POSTs
+    requester = Github(token).get_repo(repo_slug, lazy=True)._requester
+
+    try:
+        if is_issue:
+            _handle_issue(requester, repo_slug, payload, assignees)
+        else:
+            _handle_pr(requester, repo_slug, payload, assignees, reviewers)
+        return 0
+
     except GithubException as e:
         # Surface a proper annotation
         msg = getattr(e, "data", None) or str(e)
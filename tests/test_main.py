@@ -4,6 +4,7 @@
 import importlib
 import json
 import sys
+import types
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -12,129 +13,54 @@ import pytest
 
 # --- Global state for functional fakes --------------------------------------
 
-FAKE_STATE: dict[str, Any] = {"issues": {}, "prs": {}, "instance": None}
+FAKE_STATE: dict[str, Any] = {"requests": []}
 
 
 def reset_fake_state() -> None:
     """Reset all fake state between tests."""
     FAKE_STATE.clear()
-    FAKE_STATE.update({"issues": {}, "prs": {}, "instance": None})
+    FAKE_STATE.update({"requests": []})
 
 
-# --- Pure functions for issue management -------------------------------------
+# --- Pure functions for request recording -------------------------------------
 
 
-def create_issue(number: int = 1) -> dict[str, list[str]]:
-    """Create an issue dict."""
-    return {"assignees": []}
+def record_request(verb: str, url: str, input: Any = None) -> None:
+    """Record an API call made through the fake requester."""
+    FAKE_STATE["requests"].append((verb, url, input))
 
 
-def add_assignees(issue: dict[str, list[str]], *users: str) -> None:
-    """Add assignees to an issue (mutates)."""
-    issue["assignees"].extend(users)
-
-
-# --- Pure functions for PR management ----------------------------------------
-
-
-def create_pr(number: int = 2, author: str = "author") -> dict[str, Any]:
-    """Create a PR dict."""
-    return {
-        "number": number,
-        "author": author,
-        "issue": create_issue(number),
-        "requested_reviewers": [],
-    }
-
-
-def pr_as_issue(pr: dict[str, Any]) -> dict[str, list[str]]:
-    """Get issue from PR."""
-    return pr["issue"]  # type: ignore[no-any-return]
-
-
-def request_reviewers(pr: dict[str, Any], reviewers: list[str]) -> None:
-    """Request reviewers on PR (mutates)."""
-    pr["requested_reviewers"].extend(reviewers)
-
-
-# --- Pure functions for repo management --------------------------------------
-
-
-def create_repo(
-    issue_num: int = 1, pr_num: int = 2, pr_author: str = "author"
-) -> dict[str, Any]:
-    """Create a repo dict with issues and PRs."""
-    issue = create_issue(issue_num)
-    pr = create_pr(pr_num, pr_author)
-    FAKE_STATE["issues"][issue_num] = issue
-    FAKE_STATE["prs"][pr_num] = pr
-    return {"issues": FAKE_STATE["issues"], "prs": FAKE_STATE["prs"]}
-
-
-def get_issue_from_repo(repo: dict[str, Any], number: int) -> dict[str, list[str]]:
-    """Get issue from repo."""
-    return repo["issues"][number]  # type: ignore[no-any-return]
-
-
-def get_pr_from_repo(repo: dict[str, Any], number: int) -> dict[str, Any]:
-    """Get PR from repo."""
-    return repo["prs"][number]  # type: ignore[no-any-return]
+def posted(url: str) -> list[Any]:
+    """Return the bodies of all POSTs sent to the given URL."""
+    return [
+        body for verb, u, body in FAKE_STATE["requests"] if verb == "POST" and u == url
+    ]
 
 
 # --- Wrapper classes (minimal OOP interface) ---------------------------------
 
 
-class IssueWrapper:
-    """Thin wrapper around issue dict for PyGithub API compatibility."""
-
-    def __init__(self, issue_dict: dict[str, list[str]]) -> None:
-        self._dict = issue_dict
-
-    @property
-    def assignees(self) -> list[str]:
-        return self._dict["assignees"]
-
-    def add_to_assignees(self, *users: str) -> None:
-        add_assignees(self._dict, *users)
+class FakeRequester:
+    """Fake PyGithub Requester that records calls instead of sending them."""
 
-
-class PRWrapper:
-    """Thin wrapper around PR dict for PyGithub API compatibility."""
-
-    def __init__(self, pr_dict: dict[str, Any]) -> None:
-        self._dict = pr_dict
-
-    @property
-    def number(self) -> int:
-        return self._dict["number"]  # type: ignore[no-any-return]
-
-    @property
-    def requested_reviewers(self) -> list[str]:
-        return self._dict["requested_reviewers"]  # type: ignore[no-any-return]
-
-    def as_issue(self) -> IssueWrapper:
-        return IssueWrapper(pr_as_issue(self._dict))
-
-    def create_review_request(
+    def requestJsonAndCheck(
         self,
-        reviewers: list[str] | None = None,
-        team_reviewers: list[str] | None = None,
-    ) -> None:
-        if reviewers:
-            request_reviewers(self._dict, reviewers)
+        verb: str,
+        url: str,
+        parameters: Any = None,
+        headers: Any = None,
+        input: Any = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        record_request(verb, url, input)
+        return {}, {}
 
 
 class RepoWrapper:
-    """Thin wrapper around repo dict for PyGithub API compatibility."""
-
-    def __init__(self, repo_dict: dict[str, Any]) -> None:
-        self._dict = repo_dict
-
-    def get_issue(self, number: int) -> IssueWrapper:
-        return IssueWrapper(get_issue_from_repo(self._dict, number))
+    """Thin lazy repository stand-in exposing the requester."""
 
-    def get_pull(self, number: int) -> PRWrapper:
-        return PRWrapper(get_pr_from_repo(self._dict, number))
+    def __init__(self, slug: str, requester: Any = None) -> None:
+        self.url = f"/repos/{slug}"
+        self._requester = requester or FakeRequester()
 
 
 class FakeGithub:
@@ -147,14 +73,9 @@ class FakeGithub:
 
     def __init__(self, token: str) -> None:
         self.token = token
-        if FAKE_STATE["instance"] is None:
-            self.repo = RepoWrapper(create_repo())
-            FAKE_STATE["instance"] = self
-        else:
-            self.repo = FAKE_STATE["instance"].repo
 
-    def get_repo(self, slug: str) -> RepoWrapper:
-        return self.repo
+    def get_repo(self, slug: str, lazy: bool = False) -> RepoWrapper:
+        return RepoWrapper(slug)
 
 
 class FakeGithubException(Exception):
@@ -181,8 +102,14 @@ def ensure_entrypoint_on_path(tmp_path: Path, monkeypatch: Any) -> Any:
         del sys.modules["src.main"]
     module = importlib.import_module("src.main")
 
-    monkeypatch.setattr(module, "Github", FakeGithub, raising=True)
-    monkeypatch.setattr(module, "GithubException", FakeGithubException, raising=True)
+    # main() imports PyGithub lazily, so substitute the modules it imports from
+    fake_github = types.ModuleType("github")
+    fake_github.Github = FakeGithub  # type: ignore[attr-defined]
+    fake_exc = types.ModuleType("github.GithubException")
+    fake_exc.GithubException = FakeGithubException  # type: ignore[attr-defined]
+    fake_github.GithubException = fake_exc  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "github", fake_github)
+    monkeypatch.setitem(sys.modules, "github.GithubException", fake_exc)
 
     return module
 
@@ -251,6 +178,10 @@ def test_get_input_variants(ensure_entrypoint_on_path: Any, monkeypatch: Any) ->
     monkeypatch.delenv("INPUT_FOO-BAR", raising=False)
     assert m.get_input("FOO_BAR", default="def") == "def"
 
+    monkeypatch.setenv("INPUT_FOO", "v4")
+    assert m.get_input("FOO") == "v4"
+    assert m.get_input("BAR", default="def") == "def"
+
 
 def test_load_event_reads_json(
     ensure_entrypoint_on_path: Any, event_file: Callable[[dict[str, Any]], Path]
@@ -308,9 +239,10 @@ def test_issues_event_assigns_assignees(
     rc = m.main()
     assert rc == 0
 
-    repo = m.Github("x").get_repo("y")
-    issue = repo.get_issue(1)
-    assert issue.assignees == ["alice", "bob", "carol"]
+    assert posted("/repos/owner/repo/issues/1/assignees") == [
+        {"assignees": ["alice", "bob", "carol"]}
+    ]
+    assert all(verb == "POST" for verb, _, _ in FAKE_STATE["requests"])
 
 
 def test_issues_event_no_assignees_ok(
@@ -341,10 +273,13 @@ def test_pr_event_assigns_and_requests_reviewers(
     rc = m.main()
     assert rc == 0
 
-    repo = m.Github("x").get_repo("y")
-    pr = repo.get_pull(2)
-    assert pr.as_issue().assignees == ["alice", "bob"]
-    assert pr.requested_reviewers == ["bob", "carol", "dave"]
+    assert posted("/repos/owner/repo/issues/2/assignees") == [
+        {"assignees": ["alice", "bob"]}
+    ]
+    assert posted("/repos/owner/repo/pulls/2/requested_reviewers") == [
+        {"reviewers": ["bob", "carol", "dave"]}
+    ]
+    assert all(verb == "POST" for verb, _, _ in FAKE_STATE["requests"])
 
 
 def test_pr_event_filters_author_from_reviewers(
@@ -361,9 +296,9 @@ def test_pr_event_filters_author_from_reviewers(
     rc = m.main()
     assert rc == 0
 
-    repo = m.Github("x").get_repo("y")
-    pr = repo.get_pull(2)
-    assert pr.requested_reviewers == ["carol"]
+    assert posted("/repos/owner/repo/pulls/2/requested_reviewers") == [
+        {"reviewers": ["carol"]}
+    ]
 
 
 def test_pr_event_no_assignees_or_reviewers_is_ok(
@@ -378,6 +313,7 @@ def test_pr_event_no_assignees_or_reviewers_is_ok(
     monkeypatch.delenv("INPUT_REVIEWERS", raising=False)
     event_file({"pull_request": {"number": 2, "user": {"login": "author"}}})
     assert m.main() == 0
+    assert FAKE_STATE["requests"] == []
 
 
 def test_unsupported_event_is_graceful(
@@ -400,19 +336,31 @@ def test_github_exception_is_caught_and_returns_1(
     """Test that GitHub exceptions are caught and return error code."""
     m = ensure_entrypoint_on_path
 
-    class BoomRepo(RepoWrapper):
-        def get_issue(self, number: int) -> IssueWrapper:
+    class BoomRequester(FakeRequester):
+        def requestJsonAndCheck(self, *args: Any, **kwargs: Any) -> Any:
             raise FakeGithubException("nope")
 
-    class BoomGithub:
-        def __init__(self, token: str) -> None:
-            self.token = token
-
-        def get_repo(self, slug: str) -> BoomRepo:
-            return BoomRepo(create_repo())
+    class BoomGithub(FakeGithub):
+        def get_repo(self, slug: str, lazy: bool = False) -> RepoWrapper:
+            return RepoWrapper(slug, BoomRequester())
 
-    monkeypatch.setattr(m, "Github", BoomGithub, raising=True)
+    monkeypatch.setattr(sys.modules["github"], "Github", BoomGithub, raising=True)
 
     setup_base_env(monkeypatch, event="issues")
+    monkeypatch.setenv("INPUT_ASSIGNEES", "alice")
     event_file({"issue": {"number": 1}})
     assert m.main() == 1
+
+
+def test_unsupported_event_does_not_import_github(
+    ensure_entrypoint_on_path: Any,
+    monkeypatch: Any,
+    event_file: Callable[[dict[str, Any]], Path],
+) -> None:
+    """Test that early-exit paths never load PyGithub."""
+    m = ensure_entrypoint_on_path
+    # A None entry in sys.modules makes any import of it raise ImportError
+    monkeypatch.setitem(sys.modules, "github", None)
+    setup_base_env(monkeypatch, event="schedule")
+    event_file({"nothing": True})
+    assert m.main() == 0